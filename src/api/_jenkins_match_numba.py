@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Numba-compiled kernel for Jenkins job attribution scoring.
+
+Implements patterns 1-4 of JenkinsAPIClient._calculate_job_match_score
+(exact, prefix, suffix-underscore and verify-infix) using index arithmetic
+on lowercased UTF-8 job and project names.
+
+Importing this module requires Numba. JenkinsAPIClient loads it lazily and
+falls back to the pure-Python implementation when Numba is not installed.
+"""
+
+from numba import njit
+
+
+_HYPHEN = 0x2D
+_UNDERSCORE = 0x5F
+_VERIFY_PREFIX = (0x76, 0x65, 0x72, 0x69, 0x66, 0x79, 0x5F)  # b"verify_"
+
+
+@njit(cache=True, boundscheck=False)
+def _matches_at(job, offset, pjn):
+    """Return True if job[offset:offset + len(pjn)] equals pjn."""
+    n = len(pjn)
+    if offset < 0 or offset + n > len(job):
+        return False
+    # Explicit loop: Numba compiles it, but not an all() generator
+    for i in range(n):  # noqa: SIM110
+        if job[offset + i] != pjn[i]:
+            return False
+    return True
+
+
+@njit(cache=True, boundscheck=False)
+def score(job, pjn):
+    """
+    Score the leading job naming patterns for one job/project pair.
+
+    Args:
+        job: Lowercased Jenkins job name (bytes)
+        pjn: Lowercased project name in job format (bytes)
+
+    Returns:
+        Base score of the first matching pattern (0 = no match)
+    """
+    job_len = len(job)
+    n = len(pjn)
+
+    if job_len >= n and _matches_at(job, 0, pjn):
+        # PATTERN 1: Exact match
+        if job_len == n:
+            return 1000
+        # PATTERN 2a/2b: {project}-* and {project}_*
+        if job[n] == _HYPHEN:
+            return 500
+        if job[n] == _UNDERSCORE:
+            return 490
+
+    # PATTERN 3: *_{project}
+    if job_len > n and job[job_len - n - 1] == _UNDERSCORE and _matches_at(job, job_len - n, pjn):
+        return 450
+
+    # PATTERN 4: verify_{project}_* or verify_{project}
+    prefix_len = len(_VERIFY_PREFIX)
+    if job_len < prefix_len + n:
+        return 0
+    for i in range(prefix_len):
+        if job[i] != _VERIFY_PREFIX[i]:
+            return 0
+    end = prefix_len + n
+    if _matches_at(job, prefix_len, pjn) and (job_len == end or job[end] == _UNDERSCORE):
+        return 400
+
+    return 0
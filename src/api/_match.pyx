@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+
+"""
+Cython kernel for Jenkins job attribution scoring.
+
+Implements patterns 1-4 of JenkinsAPIClient._calculate_job_match_score
+(exact, prefix, suffix-underscore and verify-infix) as C loops over
+lowercased UTF-8 job and project names. The kernel runs without the GIL.
+
+This module is optional and must be compiled in place before use:
+
+    cythonize -i src/api/_match.pyx
+
+JenkinsAPIClient prefers this kernel, then the Numba kernel, then the
+pure-Python implementation.
+"""
+
+from libc.stdint cimport uint64_t
+from libc.string cimport memcmp, memcpy
+
+
+cdef unsigned char _HYPHEN = 0x2D
+cdef unsigned char _UNDERSCORE = 0x5F
+cdef const char* _VERIFY_PREFIX = b"verify_"
+cdef Py_ssize_t _VERIFY_PREFIX_LEN = 7
+
+
+cdef inline bint _bytes_equal(
+    const unsigned char* a, const unsigned char* b, Py_ssize_t n
+) noexcept nogil:
+    """Compare n bytes eight at a time, then the remaining n % 8 bytes singly."""
+    cdef uint64_t wa, wb
+    cdef Py_ssize_t i = 0
+    # memcpy into locals avoids unaligned loads; compilers emit a single
+    # 64-bit load for each
+    while i + 8 <= n:
+        memcpy(&wa, a + i, 8)
+        memcpy(&wb, b + i, 8)
+        if wa != wb:
+            return False
+        i += 8
+    while i < n:
+        if a[i] != b[i]:
+            return False
+        i += 1
+    return True
+
+
+cdef inline bint _matches_at(
+    const unsigned char[::1] job, Py_ssize_t offset, const unsigned char[::1] pjn
+) noexcept nogil:
+    """Return True if job[offset:offset + len(pjn)] equals pjn."""
+    cdef Py_ssize_t n = pjn.shape[0]
+    if offset < 0 or offset + n > job.shape[0]:
+        return False
+    if n == 0:
+        return True
+    return _bytes_equal(&job[offset], &pjn[0], n)
+
+
+cpdef int score(const unsigned char[::1] job, const unsigned char[::1] pjn) noexcept nogil:
+    """
+    Score the leading job naming patterns for one job/project pair.
+
+    Args:
+        job: Lowercased Jenkins job name (bytes)
+        pjn: Lowercased project name in job format (bytes)
+
+    Returns:
+        Base score of the first matching pattern (0 = no match)
+    """
+    cdef Py_ssize_t job_len = job.shape[0]
+    cdef Py_ssize_t n = pjn.shape[0]
+    cdef Py_ssize_t end
+
+    if job_len >= n and _matches_at(job, 0, pjn):
+        # PATTERN 1: Exact match
+        if job_len == n:
+            return 1000
+        # PATTERN 2a/2b: {project}-* and {project}_*
+        if job[n] == _HYPHEN:
+            return 500
+        if job[n] == _UNDERSCORE:
+            return 490
+
+    # PATTERN 3: *_{project}
+    if job_len > n and job[job_len - n - 1] == _UNDERSCORE and _matches_at(job, job_len - n, pjn):
+        return 450
+
+    # PATTERN 4: verify_{project}_* or verify_{project}
+    end = _VERIFY_PREFIX_LEN + n
+    if job_len < end:
+        return 0
+    if memcmp(&job[0], _VERIFY_PREFIX, _VERIFY_PREFIX_LEN) != 0:
+        return 0
+    if _matches_at(job, _VERIFY_PREFIX_LEN, pjn) and (job_len == end or job[end] == _UNDERSCORE):
+        return 400
+
+    return 0
@@ -11,9 +11,13 @@ Extracted from generate_reports.py as part of Phase 2 refactoring.
 """
 
 import logging
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import httpx
 
@@ -31,6 +35,118 @@ except ImportError:
     JJBAttribution = None
     JJBRepoManager = None
 
+# Optional Aho-Corasick automaton for the job match index
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Optional NumPy support for vectorized batch scoring
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore[assignment]
+
+
+# Job match index trie nodes are dicts keyed by byte value; this key marks a
+# node that terminates a project job name (byte keys are never negative).
+_TRIE_TERMINAL = -1
+_HYPHEN = ord("-")
+_UNDERSCORE = ord("_")
+_VERIFY_PREFIX = b"verify_"
+_VERIFY_PREFIX_LEN = len(_VERIFY_PREFIX)
+
+# Match index result for an indexed project that does not occur anywhere in
+# the job name, so no job naming pattern can match
+_NO_OCCURRENCE = -1
+
+
+def _load_match_kernel() -> Callable[[bytes, bytes], int] | None:
+    """
+    Import the fastest available compiled leading pattern kernel.
+
+    Tries the Cython extension (``api._match``, present only when built with
+    ``cythonize -i src/api/_match.pyx``), then the Numba kernel (when Numba
+    is installed).
+
+    Returns:
+        Compiled kernel taking lowercased job and project job name bytes,
+        or None to use the pure-Python implementation
+    """
+    try:
+        from ._match import score as cython_score  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return cython_score  # type: ignore[no-any-return]
+
+    try:
+        from ._jenkins_match_numba import score
+    except ImportError:
+        return None
+    return score
+
+
+def _iter_trie_terminals(
+    trie: dict[int, Any], key: bytes, start: int = 0
+) -> Iterator[tuple[str, int]]:
+    """Yield (name, end) for each trie terminal on the path spelled by key[start:]."""
+    node = trie
+    end = start
+    while True:
+        if _TRIE_TERMINAL in node:
+            yield node[_TRIE_TERMINAL], end
+        if end == len(key):
+            return
+        child = node.get(key[end])
+        if child is None:
+            return
+        node = child
+        end += 1
+
+
+def _compile_tail_table(names: Iterable[str]) -> tuple[tuple[int, ...], frozenset[str]]:
+    """Return the distinct lengths and the set of ``_{name}`` suffix tails."""
+    tails = frozenset("_" + name for name in names)
+    return tuple(sorted({len(tail) for tail in tails})), tails
+
+
+def _iter_tail_matches(
+    key: str, tail_lengths: tuple[int, ...], tails: frozenset[str]
+) -> Iterator[str]:
+    """Yield the name of each ``_{name}`` tail that key ends with."""
+    for length in tail_lengths:
+        if length > len(key):
+            return
+        tail = key[-length:]
+        if tail in tails:
+            yield tail[1:]
+
+
+def _cached_job_match_scorer(client: "JenkinsAPIClient") -> Any:
+    """
+    Return an LRU-cached scorer for one client.
+
+    The scorer holds the client through a weak reference, so the cache does
+    not keep the client alive, and looks up ``_score_job_match`` on every
+    miss, so subclass overrides and patches of that method take effect.
+    """
+    ref = weakref.ref(client)
+
+    @lru_cache(maxsize=65536)
+    def score(job_name: str, project_name: str, project_job_name: str) -> int:
+        return cast("JenkinsAPIClient", ref())._score_job_match(
+            job_name, project_name, project_job_name
+        )
+
+    return score
+
 
 class JenkinsAPIClient(BaseAPIClient):
     """
@@ -83,7 +199,24 @@ class JenkinsAPIClient(BaseAPIClient):
         self.api_base_path: str | None = None  # Will be discovered
         self._jobs_cache: dict[str, Any] = {}  # Cache for all jobs data
         self._cache_populated = False
+        self._cache_lock = threading.RLock()  # Guards the jobs cache
+        self._closed = False
         self.stats = stats
+
+        # Optional job match index over a known project set (see _build_match_index)
+        self._match_index_projects: frozenset[str] = frozenset()
+        self._match_index_forward: dict[int, Any] = {}
+        self._match_index_tail_lengths: tuple[int, ...] = ()
+        self._match_index_tails: frozenset[str] = frozenset()
+        self._match_index_hits: dict[str, dict[str, int]] = {}
+        self._match_index_lookup: Callable[[str], dict[str, int]] | None = None
+
+        # Compiled kernel for patterns 1-4 (None = pure-Python fallback)
+        self._match_kernel = _load_match_kernel()
+
+        # Match scores depend only on the three name arguments, so they are
+        # memoized per client (see _calculate_job_match_score)
+        self._score_cache = _cached_job_match_scorer(self)
         self.logger = logging.getLogger(__name__)
         self.gerrit_host = gerrit_host
 
@@ -197,6 +330,18 @@ class JenkinsAPIClient(BaseAPIClient):
 
     def close(self):
         """Close the HTTP client."""
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        """
+        Close the HTTP client once; later calls do nothing.
+
+        Safe to register with ``weakref.finalize`` alongside explicit
+        ``close()`` calls.
+        """
+        if self._closed:
+            return
+        self._closed = True
         if hasattr(self, "client"):
             self.client.close()
 
@@ -332,50 +477,64 @@ class JenkinsAPIClient(BaseAPIClient):
             >>> for job in jobs_data.get('jobs', []):
             ...     print(job['name'])
         """
-        # Return cached data if available
-        if self._cache_populated and self._jobs_cache:
-            self.logger.debug(
-                f"Using cached Jenkins jobs data ({len(self._jobs_cache.get('jobs', []))} jobs)"
-            )
-            return self._jobs_cache
+        # Serialize cache reads and the fetch that fills it, so concurrent
+        # callers sharing a client fetch the jobs list only once
+        with self._cache_lock:
+            # Return cached data if available
+            if self._cache_populated and self._jobs_cache:
+                self.logger.debug(
+                    f"Using cached Jenkins jobs data ({len(self._jobs_cache.get('jobs', []))} jobs)"
+                )
+                return self._jobs_cache
 
-        if not self.api_base_path:
-            self.logger.error(f"No valid API base path discovered for {self.host}")
-            return {}
+            if not self.api_base_path:
+                self.logger.error(f"No valid API base path discovered for {self.host}")
+                return {}
 
-        try:
-            url = (
-                f"{self.base_url}{self.api_base_path}?tree=jobs[name,url,color,buildable,disabled]"
-            )
-            self.logger.debug(f"Fetching Jenkins jobs from: {url}")
-            response = self.client.get(url)
+            try:
+                url = f"{self.base_url}{self.api_base_path}?tree=jobs[name,url,color,buildable,disabled]"
+                self.logger.debug(f"Fetching Jenkins jobs from: {url}")
+                response = self.client.get(url)
 
-            self.logger.debug(f"Jenkins API response: {response.status_code}")
-            if response.status_code == 200:
-                if self.stats:
-                    self.stats.record_success("jenkins")
-                data = response.json()
-                job_count = len(data.get("jobs", []))
-                self.logger.debug(f"Found {job_count} Jenkins jobs (cached for reuse)")
-
-                # Cache the data
-                self._jobs_cache = data
-                self._cache_populated = True
-                return dict(data)
-            else:
+                self.logger.debug(f"Jenkins API response: {response.status_code}")
+                if response.status_code == 200:
+                    if self.stats:
+                        self.stats.record_success("jenkins")
+                    data = response.json()
+                    job_count = len(data.get("jobs", []))
+                    self.logger.debug(f"Found {job_count} Jenkins jobs (cached for reuse)")
+
+                    # Cache the data (memoized index walks belong to the old job set)
+                    self._jobs_cache = data
+                    self._cache_populated = True
+                    self._match_index_hits = {}
+                    return dict(data)
+                else:
+                    if self.stats:
+                        self.stats.record_error("jenkins", response.status_code)
+                    self.logger.warning(
+                        f"❌ Error: Jenkins API query returned error code: {response.status_code} for {url}"
+                    )
+                    self.logger.warning(f"Response text: {response.text[:500]}")
+                    return {}
+
+            except Exception as e:
                 if self.stats:
-                    self.stats.record_error("jenkins", response.status_code)
-                self.logger.warning(
-                    f"❌ Error: Jenkins API query returned error code: {response.status_code} for {url}"
-                )
-                self.logger.warning(f"Response text: {response.text[:500]}")
+                    self.stats.record_exception("jenkins")
+                self.logger.error(f"❌ Error: Jenkins API query exception for {self.host}: {e}")
                 return {}
 
-        except Exception as e:
-            if self.stats:
-                self.stats.record_exception("jenkins")
-            self.logger.error(f"❌ Error: Jenkins API query exception for {self.host}: {e}")
-            return {}
+    def reset_cache(self) -> None:
+        """
+        Discard cached Jenkins jobs data so the next lookup refetches it.
+
+        Match index walks memoized for the old job set are dropped as well;
+        the project match index itself is kept.
+        """
+        with self._cache_lock:
+            self._jobs_cache = {}
+            self._cache_populated = False
+            self._match_index_hits = {}
 
     def get_jobs_for_project(
         self, project_name: str, allocated_jobs: set[str]
@@ -631,6 +790,14 @@ class JenkinsAPIClient(BaseAPIClient):
         This prevents duplicate allocation by ensuring jobs can only match one project.
         Higher scores indicate better matches. Returns 0 for no match.
 
+        Scores are memoized in a per-client LRU cache. The score depends only
+        on the three arguments, so cached results stay valid; the cache is
+        cleared when the match index is rebuilt for a different project set.
+        ``get_jobs_for_project`` scores each (job, project) pair once per
+        run, so there the cache mostly misses and only adds its lookup cost;
+        it pays off for workloads that repeat the same triples, such as the
+        test suite.
+
         Args:
             job_name: Jenkins job name
             project_name: Original Gerrit project name (with slashes)
@@ -639,59 +806,104 @@ class JenkinsAPIClient(BaseAPIClient):
         Returns:
             Match score (0 = no match, higher = better match)
         """
+        score: int = self._score_cache(job_name, project_name, project_job_name)
+        return score
+
+    def _score_job_match(self, job_name: str, project_name: str, project_job_name: str) -> int:
+        """Uncached body of ``_calculate_job_match_score``."""
         if not job_name or not project_job_name:
             return 0
 
+        # PATTERN 1 fast path: the same string object is an exact match
+        if job_name is project_job_name:
+            return 1000 + (project_name.count("/") + 1) * 50
+
         job_name_lower = job_name.lower()
         project_job_name_lower = project_job_name.lower()
 
-        score = 0
-        match_type = None
+        # Patterns 1-4 resolve from the prebuilt match index when this
+        # project is indexed, otherwise via the compiled kernel if available
+        # or direct string checks.
+        score = self._lookup_match_index(job_name_lower, project_job_name_lower)
+        if score == _NO_OCCURRENCE:
+            return 0
+        if score is None:
+            if self._match_kernel is not None:
+                score = self._match_kernel(
+                    job_name_lower.encode("utf-8"), project_job_name_lower.encode("utf-8")
+                )
+            else:
+                score = self._match_leading_patterns(job_name_lower, project_job_name_lower)
 
-        # =================================================================
-        # PATTERN 1: Exact match (highest priority)
-        # =================================================================
-        if job_name_lower == project_job_name_lower:
-            match_type = "exact"
-            score = 1000
+        return self._match_trailing_patterns(
+            job_name_lower, project_name, project_job_name_lower, score
+        )
 
-        # =================================================================
-        # PATTERN 2a: Prefix match - {project}-* (ONAP, ODL style)
-        # Example: aai-babel-maven-verify-master matches aai/babel
-        # =================================================================
-        elif job_name_lower.startswith(project_job_name_lower + "-"):
-            match_type = "prefix_hyphen"
-            score = 500
+    def _calculate_job_match_score_bytes(
+        self, job_name: bytes, project_name: bytes, project_job_name: bytes
+    ) -> int:
+        """
+        Calculate a match score from pre-lowercased UTF-8 encoded names.
 
-        # =================================================================
-        # PATTERN 2b: Prefix match - {project}_* (LF Broadband style)
-        # Example: bbsim_scale_test matches bbsim
-        # =================================================================
-        elif job_name_lower.startswith(project_job_name_lower + "_"):
-            match_type = "prefix_underscore"
-            score = 490
+        Entry point for callers that lowercase and encode their names once up
+        front (e.g. fixed tables scored repeatedly), skipping the per-call
+        ``str.lower()``/``str.encode()`` of ``_calculate_job_match_score``.
+        Leading patterns are scored directly on the bytes, by the compiled
+        kernel when available. Names with no leading match are decoded once
+        and checked against the remaining patterns only.
 
-        # =================================================================
-        # PATTERN 3: Suffix match with underscore - *_{project}
-        # Example: docker-publish_bbsim matches bbsim
-        # Example: maven-publish_aaa matches aaa
-        # Example: github-release_voltctl matches voltctl
-        # =================================================================
-        elif job_name_lower.endswith("_" + project_job_name_lower):
-            match_type = "suffix_underscore"
-            score = 450
+        Args:
+            job_name: Lowercased Jenkins job name
+            project_name: Lowercased Gerrit project name (with slashes)
+            project_job_name: Lowercased project name in job format
 
-        # =================================================================
-        # PATTERN 4: Infix match - verify_{project}_* (LF Broadband verify)
-        # Example: verify_aaa_licensed matches aaa
-        # Example: verify_bbsim_unit-test matches bbsim
-        # =================================================================
-        elif (
-            job_name_lower.startswith("verify_" + project_job_name_lower + "_")
-            or job_name_lower == "verify_" + project_job_name_lower
-        ):
-            match_type = "infix_verify"
-            score = 400
+        Returns:
+            Match score (0 = no match, higher = better match)
+        """
+        if not job_name or not project_job_name:
+            return 0
+
+        kernel = self._match_kernel or self._match_leading_patterns_bytes
+        score = kernel(job_name, project_job_name)
+        if score:
+            return score + (project_name.count(b"/") + 1) * 50
+
+        return self._match_trailing_patterns(
+            job_name.decode("utf-8"),
+            project_name.decode("utf-8"),
+            project_job_name.decode("utf-8"),
+            0,
+        )
+
+    @staticmethod
+    def _match_trailing_patterns(
+        job_name_lower: str, project_name: str, project_job_name_lower: str, score: int
+    ) -> int:
+        """
+        Check patterns 5-8 of ``_calculate_job_match_score`` and add bonuses.
+
+        Shared by the str and bytes scoring entry points once patterns 1-4
+        have been resolved, so neither lowercases names or checks the
+        leading patterns twice. Both name arguments must already be
+        lowercased.
+
+        Args:
+            job_name_lower: Lowercased Jenkins job name
+            project_name: Original Gerrit project name (with slashes)
+            project_job_name_lower: Lowercased project name in job format
+            score: Base score from patterns 1-4 (0 = no leading match)
+
+        Returns:
+            Match score (0 = no match, higher = better match)
+        """
+        # Patterns 5-8 all need the project job name inside the job name
+        if not score and project_job_name_lower not in job_name_lower:
+            return 0
+
+        match_type = None
+
+        if score:
+            match_type = "leading"
 
         # =================================================================
         # PATTERN 5: Prefix with common job type prefixes
@@ -818,6 +1030,383 @@ class JenkinsAPIClient(BaseAPIClient):
 
         return score
 
+    def score_job_matches_batch(self, jobs: Any, projects: Any, project_job_names: Any) -> Any:
+        """
+        Calculate match scores for many (job, project) pairs at once.
+
+        Vectorized equivalent of calling ``_calculate_job_match_score`` for
+        each pair. The three inputs are broadcast against each other, so
+        parallel 1-D arrays are scored row by row, while ``jobs[:, None]``
+        against ``projects[None, :]`` scores the full job x project grid.
+
+        Patterns 1-4 and the depth bonus are evaluated with ``numpy.char``
+        array operations. Only pairs matching none of those patterns, where
+        the project job name still occurs in the job name, fall back to the
+        scalar scorer for patterns 5-8 (each of which needs that substring).
+
+        Args:
+            jobs: Jenkins job names
+            projects: Original Gerrit project names (with slashes)
+            project_job_names: Project names converted to job format
+
+        Returns:
+            int32 array of match scores with the broadcast input shape, or a
+            list of scores for parallel sequences when NumPy is unavailable
+        """
+        if not NUMPY_AVAILABLE:
+            return [
+                self._calculate_job_match_score(job, project, project_job_name)
+                for job, project, project_job_name in zip(jobs, projects, project_job_names)
+            ]
+
+        jobs_arr, projects_arr, pjn_arr = np.broadcast_arrays(
+            np.asarray(jobs, dtype=str),
+            np.asarray(projects, dtype=str),
+            np.asarray(project_job_names, dtype=str),
+        )
+
+        jobs_lower = np.char.lower(jobs_arr)
+        pjn_lower = np.char.lower(pjn_arr)
+        verify_pjn = np.char.add("verify_", pjn_lower)
+
+        # Same priority order as _match_leading_patterns (first match wins)
+        base = np.select(
+            [
+                jobs_lower == pjn_lower,
+                np.char.startswith(jobs_lower, np.char.add(pjn_lower, "-")),
+                np.char.startswith(jobs_lower, np.char.add(pjn_lower, "_")),
+                np.char.endswith(jobs_lower, np.char.add("_", pjn_lower)),
+                np.char.startswith(jobs_lower, np.char.add(verify_pjn, "_"))
+                | (jobs_lower == verify_pjn),
+            ],
+            [1000, 500, 490, 450, 400],
+            default=0,
+        )
+
+        valid = (np.char.str_len(jobs_arr) > 0) & (np.char.str_len(pjn_arr) > 0)
+        depth_bonus = (np.char.count(projects_arr, "/") + 1) * 50
+        scores = np.where(valid & (base > 0), base + depth_bonus, 0).astype(np.int32)
+
+        # Patterns 5-8 stay scalar; they only apply to pairs with no leading
+        # match whose project job name occurs in the job name
+        fallback = valid & (base == 0) & (np.char.find(jobs_lower, pjn_lower) >= 0)
+        for idx in zip(*np.nonzero(fallback)):
+            scores[idx] = self._calculate_job_match_score(
+                str(jobs_arr[idx]), str(projects_arr[idx]), str(pjn_arr[idx])
+            )
+
+        return scores
+
+    @staticmethod
+    def _match_leading_patterns(job_name_lower: str, project_job_name_lower: str) -> int:
+        """
+        Check the exact, prefix, suffix and verify-infix job naming patterns.
+
+        These are patterns 1-4 of ``_calculate_job_match_score``, checked in
+        priority order. Both arguments must already be lowercased.
+
+        Args:
+            job_name_lower: Lowercased Jenkins job name
+            project_job_name_lower: Lowercased project name in job format
+
+        Returns:
+            Base score of the first matching pattern (0 = no match)
+        """
+        # =================================================================
+        # PATTERN 1: Exact match (highest priority)
+        # =================================================================
+        if job_name_lower == project_job_name_lower:
+            return 1000
+
+        # =================================================================
+        # PATTERN 2a: Prefix match - {project}-* (ONAP, ODL style)
+        # Example: aai-babel-maven-verify-master matches aai/babel
+        # =================================================================
+        if job_name_lower.startswith(project_job_name_lower + "-"):
+            return 500
+
+        # =================================================================
+        # PATTERN 2b: Prefix match - {project}_* (LF Broadband style)
+        # Example: bbsim_scale_test matches bbsim
+        # =================================================================
+        if job_name_lower.startswith(project_job_name_lower + "_"):
+            return 490
+
+        # =================================================================
+        # PATTERN 3: Suffix match with underscore - *_{project}
+        # Example: docker-publish_bbsim matches bbsim
+        # Example: maven-publish_aaa matches aaa
+        # Example: github-release_voltctl matches voltctl
+        # =================================================================
+        if job_name_lower.endswith("_" + project_job_name_lower):
+            return 450
+
+        # =================================================================
+        # PATTERN 4: Infix match - verify_{project}_* (LF Broadband verify)
+        # Example: verify_aaa_licensed matches aaa
+        # Example: verify_bbsim_unit-test matches bbsim
+        # =================================================================
+        if (
+            job_name_lower.startswith("verify_" + project_job_name_lower + "_")
+            or job_name_lower == "verify_" + project_job_name_lower
+        ):
+            return 400
+
+        return 0
+
+    @staticmethod
+    def _match_leading_patterns_bytes(job_name_lower: bytes, project_job_name_lower: bytes) -> int:
+        """
+        Bytes variant of ``_match_leading_patterns``.
+
+        Pure-Python stand-in for the compiled kernel. Each pattern is a
+        length check, one ``startswith``/``endswith`` at a fixed offset and a
+        single separator byte comparison, so no concatenated pattern strings
+        are built per call.
+
+        Args:
+            job_name_lower: Lowercased UTF-8 encoded Jenkins job name
+            project_job_name_lower: Lowercased UTF-8 encoded project job name
+
+        Returns:
+            Base score of the first matching pattern (0 = no match)
+        """
+        job_len = len(job_name_lower)
+        n = len(project_job_name_lower)
+
+        # PATTERN 1/2a/2b: exact, {project}-* and {project}_*
+        if job_len >= n and job_name_lower.startswith(project_job_name_lower):
+            if job_len == n:
+                return 1000
+            if job_name_lower[n] == _HYPHEN:
+                return 500
+            if job_name_lower[n] == _UNDERSCORE:
+                return 490
+
+        # PATTERN 3: *_{project}
+        if (
+            job_len > n
+            and job_name_lower[job_len - n - 1] == _UNDERSCORE
+            and job_name_lower.endswith(project_job_name_lower)
+        ):
+            return 450
+
+        # PATTERN 4: verify_{project}_* or verify_{project}
+        end = _VERIFY_PREFIX_LEN + n
+        if (
+            job_len >= end
+            and job_name_lower.startswith(_VERIFY_PREFIX)
+            and job_name_lower.startswith(project_job_name_lower, _VERIFY_PREFIX_LEN)
+            and (job_len == end or job_name_lower[end] == _UNDERSCORE)
+        ):
+            return 400
+
+        return 0
+
+    def _build_match_index(self, projects: Iterable[str]) -> None:
+        """
+        Build a match index over a known set of Gerrit project names.
+
+        Callers that score every job against every project pay
+        O(jobs x projects) string comparisons for patterns 1-4 of
+        ``_calculate_job_match_score``. The index resolves those patterns for
+        all indexed projects in one pass over the job name, and the result
+        is memoized per job, so each further (job, project) pair costs a
+        dictionary lookup.
+
+        The matcher is an Aho-Corasick automaton (see
+        ``_compile_match_automaton``) when pyahocorasick is installed.
+        Otherwise the index is:
+        - a trie over lowercase UTF-8 bytes of the project job names, for
+          the exact and prefix patterns, plus the verify infix pattern when
+          walked from just after ``verify_``
+        - a tail table of ``_{project}`` strings grouped by length, for the
+          ``*_{project}`` suffix pattern: one set probe per distinct length
+
+        The index also records every project occurring anywhere in the job
+        name. Patterns 5-8 all require the project job name as a substring,
+        so an indexed project that does not occur scores 0 without checking
+        them.
+
+        Projects that are not in the index keep using direct string checks.
+        The compiled matcher is reused while the project set is unchanged;
+        a different project set replaces it.
+
+        Args:
+            projects: Gerrit project names (with slashes)
+        """
+        names = frozenset(
+            name for name in (project.replace("/", "-").lower() for project in projects) if name
+        )
+        if names == self._match_index_projects and self._match_index_lookup is not None:
+            return
+
+        forward: dict[int, Any] = {}
+        tail_lengths: tuple[int, ...] = ()
+        tails: frozenset[str] = frozenset()
+
+        if AHOCORASICK_AVAILABLE:
+            lookup = self._compile_match_automaton(names)
+        else:
+            for name in names:
+                node = forward
+                for byte in name.encode("utf-8"):
+                    node = node.setdefault(byte, {})
+                node[_TRIE_TERMINAL] = name
+            tail_lengths, tails = _compile_tail_table(names)
+            lookup = self._walk_match_index
+
+        self._match_index_projects = names
+        self._match_index_forward = forward
+        self._match_index_tail_lengths = tail_lengths
+        self._match_index_tails = tails
+        self._match_index_lookup = lookup
+        self._match_index_hits = {}
+        self._score_cache.cache_clear()
+        self.logger.debug(f"Built job match index for {len(names)} projects")
+
+    @staticmethod
+    def _compile_match_automaton(projects: Iterable[str]) -> Callable[[str], dict[str, int]]:
+        """
+        Compile an Aho-Corasick matcher for patterns 1-4 over a project set.
+
+        The automaton holds one key per project and pattern: ``{p}-``,
+        ``{p}_`` and ``verify_{p}_``, all anchored at the start of the job
+        name, plus ``{p}`` itself at any position to record occurrences. A
+        single scan of the job name reports every key, in C. Exact and
+        ``verify_{p}`` matches are set lookups, and ``*_{p}`` suffixes are
+        probed in a tail table grouped by length.
+
+        Pattern scores decrease with pattern priority, so keeping the highest
+        score per project gives the same result as checking the patterns in
+        order.
+
+        Args:
+            projects: Gerrit project names (with slashes) or project job names
+
+        Returns:
+            Function mapping a lowercased job name to the base score of each
+            project job name occurring in it (0 = occurs, no pattern 1-4 match)
+        """
+        names = frozenset(
+            name for name in (project.replace("/", "-").lower() for project in projects) if name
+        )
+
+        tail_lengths, tails = _compile_tail_table(names)
+
+        # key -> (project job name, base score, key length); score 0 marks an
+        # unanchored occurrence key
+        entries: dict[str, list[tuple[str, int, int]]] = {}
+        for name in names:
+            for key, score in (
+                (name, 0),
+                (name + "-", 500),
+                (name + "_", 490),
+                ("verify_" + name + "_", 400),
+            ):
+                entries.setdefault(key, []).append((name, score, len(key)))
+
+        automaton = ahocorasick.Automaton()
+        for key, key_entries in entries.items():
+            automaton.add_word(key, tuple(key_entries))
+        if entries:
+            automaton.make_automaton()
+
+        def lookup(job_name_lower: str) -> dict[str, int]:
+            hits: dict[str, int] = {}
+            if job_name_lower in names:
+                hits[job_name_lower] = 1000
+            if job_name_lower.startswith("verify_") and job_name_lower[7:] in names:
+                hits.setdefault(job_name_lower[7:], 400)
+            if not entries:
+                return hits
+
+            for end, key_entries in automaton.iter(job_name_lower):
+                for name, score, key_len in key_entries:
+                    if not score:
+                        hits.setdefault(name, 0)
+                    elif end == key_len - 1 and score > hits.get(name, 0):
+                        hits[name] = score
+            for name in _iter_tail_matches(job_name_lower, tail_lengths, tails):
+                if hits.get(name, 0) < 450:
+                    hits[name] = 450
+            return hits
+
+        return lookup
+
+    def _lookup_match_index(self, job_name_lower: str, project_job_name_lower: str) -> int | None:
+        """
+        Look up the patterns 1-4 base score for a job from the match index.
+
+        Args:
+            job_name_lower: Lowercased Jenkins job name
+            project_job_name_lower: Lowercased project name in job format
+
+        Returns:
+            Base score (0 = no pattern 1-4 match), ``_NO_OCCURRENCE`` if the
+            project does not occur in the job name, or None if the project
+            is not indexed
+        """
+        if project_job_name_lower not in self._match_index_projects:
+            return None
+
+        hits = self._match_index_hits.get(job_name_lower)
+        if hits is None and self._match_index_lookup is not None:
+            hits = self._match_index_lookup(job_name_lower)
+            self._match_index_hits[job_name_lower] = hits
+
+        if hits is None:
+            return None
+        return hits.get(project_job_name_lower, _NO_OCCURRENCE)
+
+    def _walk_match_index(self, job_name_lower: str) -> dict[str, int]:
+        """
+        Resolve patterns 1-4 for every indexed project from the trie and tail table.
+
+        Fallback matcher used when pyahocorasick is not installed.
+
+        Args:
+            job_name_lower: Lowercased Jenkins job name
+
+        Returns:
+            Dictionary mapping each project job name occurring in the job
+            name to its base score (0 = occurs, no pattern 1-4 match)
+        """
+        job_bytes = job_name_lower.encode("utf-8")
+        length = len(job_bytes)
+        hits: dict[str, int] = {}
+
+        # Patterns 1, 2a and 2b: a project name is terminal at exactly one
+        # depth, so each project gets at most one of these scores
+        for name, end in _iter_trie_terminals(self._match_index_forward, job_bytes):
+            if end == length:
+                hits[name] = 1000
+            elif job_bytes[end] == _HYPHEN:
+                hits[name] = 500
+            elif job_bytes[end] == _UNDERSCORE:
+                hits[name] = 490
+
+        # Pattern 3: *_{project} via the tail table
+        for name in _iter_tail_matches(
+            job_name_lower, self._match_index_tail_lengths, self._match_index_tails
+        ):
+            hits.setdefault(name, 450)
+
+        # Pattern 4: verify_{project}_* or verify_{project}
+        if job_bytes.startswith(_VERIFY_PREFIX):
+            for name, end in _iter_trie_terminals(
+                self._match_index_forward, job_bytes, _VERIFY_PREFIX_LEN
+            ):
+                if end == length or job_bytes[end] == _UNDERSCORE:
+                    hits.setdefault(name, 400)
+
+        # Occurrences without a pattern 1-4 match: walk the trie from every offset
+        for start in range(length):
+            for name, _ in _iter_trie_terminals(self._match_index_forward, job_bytes, start):
+                hits.setdefault(name, 0)
+
+        return hits
+
     def get_job_details(self, job_name: str) -> dict[str, Any]:
         """
         Get detailed information about a specific job.
@@ -933,6 +933,10 @@ class GitDataCollector:
             f"Found {len(archived_projects)} archived/read-only projects in Gerrit"
         )
 
+        # Index the archived projects once so each job resolves in a single pass
+        if self.jenkins_client:
+            self.jenkins_client._build_match_index(archived_projects)
+
         # Try to match jobs to archived projects using same logic as active projects
         for job_name in list(
             unallocated_jobs
@@ -154,3 +154,31 @@ def auto_clean_environment():
 
     # Clean environment after test
     ensure_clean_environment()
+
+
+# ============================================================================
+# Parallel Execution (pytest-xdist)
+# ============================================================================
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Verify fixtures named by the session_fixtures marker are session-scoped.
+
+    Under ``pytest -n <workers> --dist=loadscope`` each worker builds a
+    session-scoped fixture once. A narrower scope would silently rebuild
+    expensive shared fixtures (API clients, parsed fixture data) per test.
+    """
+    for item in items:
+        marker = item.get_closest_marker("session_fixtures")
+        fixture_info = getattr(item, "_fixtureinfo", None)
+        if marker is None or fixture_info is None:
+            continue
+
+        for name in marker.args:
+            fixture_defs = fixture_info.name2fixturedefs.get(name)
+            if fixture_defs and fixture_defs[-1].scope != "session":
+                raise pytest.UsageError(
+                    f"{item.nodeid}: fixture '{name}' must be session-scoped "
+                    f"for parallel execution (found scope '{fixture_defs[-1].scope}')"
+                )
@@ -15,6 +15,7 @@ Tests cover:
 - Edge cases and integration scenarios
 """
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -201,6 +202,34 @@ class TestGetAllJobs:
         assert jenkins_client.client.get.call_count == 1  # Not called again
         assert result1 == result2
 
+    def test_get_all_jobs_concurrent_callers_fetch_once(self, jenkins_client):
+        """Test that threads sharing a client fetch the jobs list only once."""
+        jobs_data = {"jobs": [create_mock_job("job1")]}
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+
+        def slow_get(url):
+            fetch_started.set()
+            release_fetch.wait(timeout=5)
+            return Mock(status_code=200, json=Mock(return_value=jobs_data))
+
+        jenkins_client.client.get = Mock(side_effect=slow_get)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(jenkins_client.get_all_jobs()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        fetch_started.wait(timeout=5)
+        release_fetch.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert jenkins_client.client.get.call_count == 1
+        assert results == [jobs_data] * 4
+
     def test_get_all_jobs_error(self, jenkins_client, mock_stats):
         """Test handling HTTP error when fetching jobs."""
         mock_response = Mock()
@@ -683,6 +712,16 @@ class TestContextManager:
 
             mock_client.close.assert_called()
 
+    def test_close_is_idempotent(self, jenkins_client):
+        """Test that repeated close/_shutdown calls close the HTTP client once."""
+        jenkins_client.client = Mock()
+
+        jenkins_client.close()
+        jenkins_client._shutdown()
+        jenkins_client.close()
+
+        jenkins_client.client.close.assert_called_once()
+
 
 # ============================================================================
 # Test Statistics Integration
@@ -15,16 +15,62 @@ https://github.com/lfreleng-actions/project-reporting-artifacts/tree/main/data/a
 
 Run these tests with:
     pytest tests/unit/test_job_attribution.py -v
+
+or in parallel (one worker per core, each building the shared fixtures once):
+    pytest tests/unit/test_job_attribution.py -n $(nproc) --dist=loadscope -q
 """
 
-import json
+import weakref
+from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import numpy as np
+import orjson
 import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
 
+import api.jenkins_client as jenkins_client_module
 from api.jenkins_client import JenkinsAPIClient
+from lf_releng_project_reporting.collectors.git import GitDataCollector
+
+
+# Shared fixtures are built once per xdist worker; see tests/conftest.py
+pytestmark = pytest.mark.session_fixtures(
+    "mock_stats", "jenkins_client", "production_fixtures", "production_tables"
+)
+
+# Projects referenced by the case tables below; the jenkins_client
+# fixture indexes these so scalar scoring exercises the match index path.
+INDEXED_PROJECTS = (
+    "test/project",
+    "sdc",
+    "integration",
+    "aai/babel",
+    "cps",
+    "demo",
+    "dcaegen2/analytics/tca-gen2",
+    "ccsdk/apps",
+    "multicloud/framework",
+    "aai/aai-common",
+    "ci-management",
+    "bbsim",
+    "voltha-go",
+    "voltha-openolt-adapter",
+    "aaa",
+    "sadis",
+    "voltctl",
+    "voltha-docs",
+    "bbsim-sadis-server",
+    "aaaa",
+    "aab",
+    "tosca",
+    "babel",
+    "voltha-go-controller",
+)
 
 
 # =============================================================================
@@ -32,7 +78,7 @@ from api.jenkins_client import JenkinsAPIClient
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_stats():
     """Create a mock stats object for JenkinsAPIClient."""
     stats = Mock()
@@ -41,36 +87,182 @@ def mock_stats():
     return stats
 
 
-@pytest.fixture
-def jenkins_client(mock_stats):
-    """Create a JenkinsAPIClient instance for testing."""
-    client = JenkinsAPIClient(host="jenkins.example.com", timeout=30.0, stats=mock_stats)
-    # Mock the discovery to avoid network calls
+def _offline_client(stats: Mock) -> JenkinsAPIClient:
+    """Create a JenkinsAPIClient without the network API discovery request."""
+    with patch.object(JenkinsAPIClient, "_discover_api_base_path"):
+        client = JenkinsAPIClient(host="jenkins.example.com", timeout=30.0, stats=stats)
     client.api_base_path = "/api/json"
+    return client
+
+
+@pytest.fixture(scope="session")
+def jenkins_client(mock_stats):
+    """Create a JenkinsAPIClient instance shared by all tests in the session."""
+    client = _offline_client(mock_stats)
     client._cache_populated = False
     client._jobs_cache = {}
-    yield client
-    client.close()
+    client._build_match_index(INDEXED_PROJECTS)
+    # Warm the compiled match kernel (if any) so JIT cost is not paid mid-test
+    client._calculate_job_match_score("warm-up", "warm", "warm")
+    # Close the HTTP client once, at interpreter exit, rather than via teardown
+    weakref.finalize(client, client._shutdown)
+    return client
 
 
 @pytest.fixture
-def production_fixtures() -> dict[str, Any]:
-    """Load production data fixtures for integration testing."""
+def make_client(mock_stats):
+    """Factory for private JenkinsAPIClient instances, closed at teardown."""
+    clients: list[JenkinsAPIClient] = []
+
+    def factory() -> JenkinsAPIClient:
+        client = _offline_client(mock_stats)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+def _lowercase_fixture_names(data: dict[str, Any]) -> dict[str, Any]:
+    """Lowercase the job and project names scored by the fixture-driven tests."""
+    for section, key in (("onap", "known_working_mappings"), ("lfbroadband", "expected_mappings")):
+        mappings = data.get(section, {}).get(key)
+        if mappings is not None:
+            data[section][key] = {job.lower(): project.lower() for job, project in mappings.items()}
+
+    for case in data.get("negative_test_cases", {}).get("cases", []):
+        case["job"] = case["job"].lower()
+        case["wrong_project"] = case["wrong_project"].lower()
+
+    return data
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state(mock_stats, jenkins_client):
+    """Reset the session-scoped stats mock and client caches before each test."""
+    mock_stats.reset_mock()
+    jenkins_client.reset_cache()
+
+
+@pytest.fixture(scope="session")
+def production_fixtures() -> Mapping[str, Any]:
+    """Load production data fixtures once for integration testing (read-only)."""
     fixture_path = (
         Path(__file__).parent.parent / "fixtures" / "job_attribution" / "production_data.json"
     )
     if fixture_path.exists():
-        with open(fixture_path) as f:
-            return json.load(f)
+        data = orjson.loads(fixture_path.read_bytes())
+        return MappingProxyType(_lowercase_fixture_names(data))
     else:
         pytest.skip(f"Fixture file not found: {fixture_path}")
 
 
+def _columns(rows: Iterable[tuple[str, ...]], names: tuple[str, ...]) -> Mapping[str, np.ndarray]:
+    """Transpose rows into read-only named column arrays, adding a ``pjn`` column."""
+    materialized = list(rows)
+    columns = {
+        name: np.array([row[i] for row in materialized], dtype=str) for i, name in enumerate(names)
+    }
+    columns["pjn"] = np.char.replace(columns["project"], "/", "-")
+    for column in columns.values():
+        column.setflags(write=False)
+    return MappingProxyType(columns)
+
+
+@pytest.fixture(scope="session")
+def production_tables(production_fixtures) -> Mapping[str, Mapping[str, np.ndarray]]:
+    """
+    Production fixture rows as structure-of-arrays tables, built once.
+
+    Each section present in the fixtures maps to job, project and pjn
+    (project job name) columns; negative cases also carry a reason column.
+    """
+    tables = {}
+    for section, key in (("onap", "known_working_mappings"), ("lfbroadband", "expected_mappings")):
+        if section in production_fixtures:
+            mappings = production_fixtures[section].get(key, {})
+            tables[section] = _columns(mappings.items(), ("job", "project"))
+
+    if "negative_test_cases" in production_fixtures:
+        cases = production_fixtures["negative_test_cases"].get("cases", [])
+        tables["negative_test_cases"] = _columns(
+            (
+                (case["job"], case["wrong_project"], case.get("reason", "No reason provided"))
+                for case in cases
+            ),
+            ("job", "project", "reason"),
+        )
+
+    return MappingProxyType(tables)
+
+
+# =============================================================================
+# Case Tables
+# =============================================================================
+
+# Case tuples hold one (job, project, should_match) row each. Hypothesis tests
+# sample rows from them; the bulk tests score each as a structure-of-arrays
+# table in a single batch call.
+CASE_DTYPE = [("job", "U128"), ("project", "U128"), ("pjn", "U128"), ("match", "?")]
+
+# Hypothesis reuses the session client across examples; the function-scoped
+# autouse reset only clears caches, so sharing it between examples is safe.
+CASE_SETTINGS = settings(deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+
+
+def _case_table(rows: Sequence[tuple[str, str, bool]]) -> np.ndarray:
+    """Build a case table from (job, project, should_match) rows."""
+    return np.array(
+        [(job, project, project.replace("/", "-"), match) for job, project, match in rows],
+        dtype=CASE_DTYPE,
+    )
+
+
+def _params(prefix: str, rows: Iterable[tuple[Any, ...]]) -> list[Any]:
+    """Wrap rows as pytest params with short index ids instead of repr'd values."""
+    return [pytest.param(*row, id=f"{prefix}-{i:02d}") for i, row in enumerate(rows)]
+
+
+def _assert_case_table(scores: np.ndarray, cases: np.ndarray) -> None:
+    """Fail with the first mismatching row if any score disagrees with its row."""
+    ok = (scores > 0) == cases["match"]
+    if not np.all(ok):
+        pytest.fail(
+            f"mismatch: {cases[~ok][0]} (score {scores[~ok][0]}; "
+            f"{np.count_nonzero(~ok)} of {len(cases)} rows failed)"
+        )
+
+
 # =============================================================================
 # Test: ONAP Prefix-Based Matching (Regression Protection)
 # =============================================================================
 
 
+ONAP_CASES = (
+    # Exact matches
+    ("test-project", "test/project", True),
+    ("sdc", "sdc", True),
+    ("integration", "integration", True),
+    # Prefix matches with dash separator
+    ("aai-babel-maven-verify-master", "aai/babel", True),
+    ("sdc-verify-java", "sdc", True),
+    ("integration-master-merge-java", "integration", True),
+    ("cps-master-verify-java", "cps", True),
+    ("demo-maven-stage-master", "demo", True),
+    # Multi-level project paths
+    ("dcaegen2-analytics-tca-gen2-maven-clm-master", "dcaegen2/analytics/tca-gen2", True),
+    ("ccsdk-apps-maven-docker-stage-master", "ccsdk/apps", True),
+    ("multicloud-framework-artifactbroker-sonar", "multicloud/framework", True),
+    # Non-matches (must return 0)
+    ("other-job", "test/project", False),
+    ("xsdc-verify", "sdc", False),  # Different prefix
+    ("babel", "aai/babel", False),  # Missing parent prefix
+    ("random-job-name", "cps", False),
+)
+ONAP_TABLE = _case_table(ONAP_CASES)
+
+
 class TestONAPPrefixMatching:
     """
     Regression tests for ONAP-style prefix-based job matching.
@@ -84,50 +276,20 @@ class TestONAPPrefixMatching:
     These tests MUST pass before and after any changes to the matching algorithm.
     """
 
-    @pytest.mark.parametrize(
-        "job_name,project_name,project_job_name,should_match",
-        [
-            # Exact matches
-            ("test-project", "test/project", "test-project", True),
-            ("sdc", "sdc", "sdc", True),
-            ("integration", "integration", "integration", True),
-            # Prefix matches with dash separator
-            ("aai-babel-maven-verify-master", "aai/babel", "aai-babel", True),
-            ("sdc-verify-java", "sdc", "sdc", True),
-            ("integration-master-merge-java", "integration", "integration", True),
-            ("cps-master-verify-java", "cps", "cps", True),
-            ("demo-maven-stage-master", "demo", "demo", True),
-            # Multi-level project paths
-            (
-                "dcaegen2-analytics-tca-gen2-maven-clm-master",
-                "dcaegen2/analytics/tca-gen2",
-                "dcaegen2-analytics-tca-gen2",
-                True,
-            ),
-            ("ccsdk-apps-maven-docker-stage-master", "ccsdk/apps", "ccsdk-apps", True),
-            (
-                "multicloud-framework-artifactbroker-sonar",
-                "multicloud/framework",
-                "multicloud-framework",
-                True,
-            ),
-            # Non-matches (must return 0)
-            ("other-job", "test/project", "test-project", False),
-            ("xsdc-verify", "sdc", "sdc", False),  # Different prefix
-            ("babel", "aai/babel", "aai-babel", False),  # Missing parent prefix
-            ("random-job-name", "cps", "cps", False),
-        ],
-    )
-    def test_prefix_matching_preserved(
-        self, jenkins_client, job_name, project_name, project_job_name, should_match
-    ):
+    def test_prefix_matching_preserved_bulk(self, jenkins_client):
         """Verify prefix-based matching behavior is preserved for ONAP patterns."""
-        score = jenkins_client._calculate_job_match_score(job_name, project_name, project_job_name)
+        scores = jenkins_client.score_job_matches_batch(
+            ONAP_TABLE["job"], ONAP_TABLE["project"], ONAP_TABLE["pjn"]
+        )
+        _assert_case_table(scores, ONAP_TABLE)
 
-        if should_match:
-            assert score > 0, f"Expected '{job_name}' to match project '{project_name}'"
-        else:
-            assert score == 0, f"Expected '{job_name}' NOT to match project '{project_name}'"
+    @CASE_SETTINGS
+    @given(case=st.sampled_from(ONAP_CASES))
+    def test_onap_case(self, jenkins_client, case):
+        """Each ONAP row scores as a match exactly when it is expected to."""
+        job, project, should_match = case
+        score = jenkins_client._calculate_job_match_score(job, project, project.replace("/", "-"))
+        assert (score > 0) == should_match, f"{job} -> {project}: score {score}"
 
     def test_exact_match_highest_score(self, jenkins_client):
         """Verify exact match gets the highest score."""
@@ -171,6 +333,29 @@ class TestONAPPrefixMatching:
         assert score_deep > score_shallow, "Deeper project paths should have higher scores"
 
 
+ONAP_MAPPING_CASES = (
+    # AAI project jobs
+    ("aai-aai-common-master-merge-java", "aai/aai-common", True),
+    ("aai-aai-common-master-verify-java", "aai/aai-common", True),
+    ("aai-aai-common-maven-clm-master", "aai/aai-common", True),
+    # CCSDK project jobs
+    ("ccsdk-apps-maven-clm-master", "ccsdk/apps", True),
+    ("ccsdk-apps-maven-docker-stage-master", "ccsdk/apps", True),
+    # CI-Management jobs
+    ("ci-management-jenkins-cfg-verify", "ci-management", True),
+    # CPS project jobs
+    ("cps-master-merge-java", "cps", True),
+    ("cps-master-verify-java", "cps", True),
+    ("cps-maven-clm-master", "cps", True),
+    # Demo project jobs
+    ("demo-master-merge-java", "demo", True),
+    ("demo-master-verify-java", "demo", True),
+    # Integration project jobs
+    ("integration-master-verify-python", "integration", True),
+)
+ONAP_MAPPING_TABLE = _case_table(ONAP_MAPPING_CASES)
+
+
 class TestONAPProductionRegression:
     """
     Regression tests using actual ONAP production data.
@@ -179,57 +364,27 @@ class TestONAPProductionRegression:
     the current working behavior that MUST be preserved.
     """
 
-    @pytest.mark.parametrize(
-        "job_name,expected_project",
-        [
-            # AAI project jobs
-            ("aai-aai-common-master-merge-java", "aai/aai-common"),
-            ("aai-aai-common-master-verify-java", "aai/aai-common"),
-            ("aai-aai-common-maven-clm-master", "aai/aai-common"),
-            # CCSDK project jobs
-            ("ccsdk-apps-maven-clm-master", "ccsdk/apps"),
-            ("ccsdk-apps-maven-docker-stage-master", "ccsdk/apps"),
-            # CI-Management jobs
-            ("ci-management-jenkins-cfg-verify", "ci-management"),
-            # CPS project jobs
-            ("cps-master-merge-java", "cps"),
-            ("cps-master-verify-java", "cps"),
-            ("cps-maven-clm-master", "cps"),
-            # Demo project jobs
-            ("demo-master-merge-java", "demo"),
-            ("demo-master-verify-java", "demo"),
-            # Integration project jobs
-            ("integration-master-verify-python", "integration"),
-        ],
-    )
-    def test_onap_known_mappings(self, jenkins_client, job_name, expected_project):
+    def test_onap_known_mappings_bulk(self, jenkins_client):
         """Verify known ONAP job->project mappings continue to work."""
-        project_job_name = expected_project.replace("/", "-")
-        score = jenkins_client._calculate_job_match_score(
-            job_name, expected_project, project_job_name
+        scores = jenkins_client.score_job_matches_batch(
+            ONAP_MAPPING_TABLE["job"], ONAP_MAPPING_TABLE["project"], ONAP_MAPPING_TABLE["pjn"]
         )
+        _assert_case_table(scores, ONAP_MAPPING_TABLE)
 
-        assert score > 0, (
-            f"REGRESSION: Job '{job_name}' should match project '{expected_project}' "
-            f"but got score {score}"
-        )
-
-    def test_onap_production_fixtures(self, jenkins_client, production_fixtures):
+    def test_onap_production_fixtures(self, jenkins_client, production_tables):
         """Test all ONAP mappings from production fixtures."""
-        if "onap" not in production_fixtures:
+        if "onap" not in production_tables:
             pytest.skip("ONAP fixtures not available")
 
-        onap_data = production_fixtures["onap"]
-        mappings = onap_data.get("known_working_mappings", {})
-
-        failures = []
-        for job_name, expected_project in mappings.items():
-            project_job_name = expected_project.replace("/", "-")
-            score = jenkins_client._calculate_job_match_score(
-                job_name, expected_project, project_job_name
-            )
-            if score == 0:
-                failures.append(f"{job_name} -> {expected_project}")
+        table = production_tables["onap"]
+        scores = jenkins_client.score_job_matches_batch(
+            table["job"], table["project"], table["pjn"]
+        )
+        missed = scores == 0
+        failures = [
+            f"{job_name} -> {project}"
+            for job_name, project in zip(table["job"][missed], table["project"][missed])
+        ]
 
         assert len(failures) == 0, (
             f"REGRESSION: {len(failures)} ONAP mappings failed:\n"
@@ -243,6 +398,30 @@ class TestONAPProductionRegression:
 # =============================================================================
 
 
+LFB_CASES = (
+    # Pattern: {job-type}_{project-name} (suffix with underscore)
+    ("docker-publish_bbsim", "bbsim", True),
+    ("docker-publish_voltha-go", "voltha-go", True),
+    ("docker-publish_voltha-openolt-adapter", "voltha-openolt-adapter", True),
+    ("maven-publish_aaa", "aaa", True),
+    ("maven-publish_sadis", "sadis", True),
+    ("github-release_bbsim", "bbsim", True),
+    ("github-release_voltctl", "voltctl", True),
+    # Pattern: verify_{project-name}_{job-type} (infix)
+    ("verify_aaa_licensed", "aaa", True),
+    ("verify_aaa_maven-test", "aaa", True),
+    ("verify_bbsim_unit-test", "bbsim", True),
+    ("verify_bbsim_licensed", "bbsim", True),
+    ("verify_voltha-go_sanity-test", "voltha-go", True),
+    ("verify_voltha-docs_licensed", "voltha-docs", True),
+    # Negative cases - should NOT match wrong projects
+    ("docker-publish_bbsim", "bbsim-sadis-server", False),
+    ("verify_aaa_licensed", "aaaa", False),
+    ("verify_aaa_licensed", "aab", False),
+)
+LFB_TABLE = _case_table(LFB_CASES)
+
+
 class TestLFBroadbandPatterns:
     """
     Tests for LF Broadband job naming patterns.
@@ -256,46 +435,20 @@ class TestLFBroadbandPatterns:
     Initially these tests may fail (marking the feature as not yet implemented).
     """
 
-    @pytest.mark.parametrize(
-        "job_name,project_name,should_match",
-        [
-            # Pattern: {job-type}_{project-name} (suffix with underscore)
-            ("docker-publish_bbsim", "bbsim", True),
-            ("docker-publish_voltha-go", "voltha-go", True),
-            ("docker-publish_voltha-openolt-adapter", "voltha-openolt-adapter", True),
-            ("maven-publish_aaa", "aaa", True),
-            ("maven-publish_sadis", "sadis", True),
-            ("github-release_bbsim", "bbsim", True),
-            ("github-release_voltctl", "voltctl", True),
-            # Pattern: verify_{project-name}_{job-type} (infix)
-            ("verify_aaa_licensed", "aaa", True),
-            ("verify_aaa_maven-test", "aaa", True),
-            ("verify_bbsim_unit-test", "bbsim", True),
-            ("verify_bbsim_licensed", "bbsim", True),
-            ("verify_voltha-go_sanity-test", "voltha-go", True),
-            ("verify_voltha-docs_licensed", "voltha-docs", True),
-            # Negative cases - should NOT match wrong projects
-            ("docker-publish_bbsim", "bbsim-sadis-server", False),
-            ("verify_aaa_licensed", "aaaa", False),
-            ("verify_aaa_licensed", "aab", False),
-        ],
-    )
-    def test_lfbroadband_patterns(self, jenkins_client, job_name, project_name, should_match):
-        """
-        Test LF Broadband job naming patterns.
-
-        NOTE: This test documents EXPECTED behavior. It may initially fail
-        until the matching algorithm is enhanced to support these patterns.
-        """
-        project_job_name = project_name.replace("/", "-")
-        score = jenkins_client._calculate_job_match_score(job_name, project_name, project_job_name)
+    def test_lfbroadband_patterns_bulk(self, jenkins_client):
+        """Test LF Broadband job naming patterns."""
+        scores = jenkins_client.score_job_matches_batch(
+            LFB_TABLE["job"], LFB_TABLE["project"], LFB_TABLE["pjn"]
+        )
+        _assert_case_table(scores, LFB_TABLE)
 
-        if should_match:
-            assert score > 0, (
-                f"Expected '{job_name}' to match project '{project_name}' (LF Broadband pattern)"
-            )
-        else:
-            assert score == 0, f"Expected '{job_name}' NOT to match project '{project_name}'"
+    @CASE_SETTINGS
+    @given(case=st.sampled_from(LFB_CASES))
+    def test_lfbroadband_case(self, jenkins_client, case):
+        """Each LF Broadband row scores as a match exactly when it is expected to."""
+        job, project, should_match = case
+        score = jenkins_client._calculate_job_match_score(job, project, project.replace("/", "-"))
+        assert (score > 0) == should_match, f"{job} -> {project}: score {score}"
 
     def test_suffix_pattern_docker_publish(self, jenkins_client):
         """Test docker-publish_{project} pattern matching."""
@@ -334,28 +487,27 @@ class TestLFBroadbandPatterns:
             score = jenkins_client._calculate_job_match_score(job_name, project, project)
             assert score > 0, f"{job_name} should match {project}"
 
-    def test_lfbroadband_production_fixtures(self, jenkins_client, production_fixtures):
+    def test_lfbroadband_production_fixtures(
+        self, jenkins_client, production_fixtures, production_tables
+    ):
         """Test LF Broadband expected mappings from production fixtures."""
-        if "lfbroadband" not in production_fixtures:
+        if "lfbroadband" not in production_tables:
             pytest.skip("LF Broadband fixtures not available")
 
         lfb_data = production_fixtures["lfbroadband"]
-        expected_mappings = lfb_data.get("expected_mappings", {})
+        table = production_tables["lfbroadband"]
 
-        matched = 0
-        failed = []
-
-        for job_name, expected_project in expected_mappings.items():
-            project_job_name = expected_project.replace("/", "-")
-            score = jenkins_client._calculate_job_match_score(
-                job_name, expected_project, project_job_name
-            )
-            if score > 0:
-                matched += 1
-            else:
-                failed.append(f"{job_name} -> {expected_project}")
+        scores = jenkins_client.score_job_matches_batch(
+            table["job"], table["project"], table["pjn"]
+        )
+        matched = int(np.count_nonzero(scores > 0))
+        missed = scores == 0
+        failed = [
+            f"{job_name} -> {project}"
+            for job_name, project in zip(table["job"][missed], table["project"][missed])
+        ]
 
-        total = len(expected_mappings)
+        total = len(table["job"])
         match_rate = (matched / total * 100) if total > 0 else 0
 
         # We expect at least 80% of LF Broadband jobs to match with the enhanced algorithm
@@ -375,6 +527,32 @@ class TestLFBroadbandPatterns:
 # =============================================================================
 
 
+NEGATIVE_CASES = (
+    # Prefix should not match substring
+    ("sdc-tosca-verify", "tosca", "tosca is a component of sdc, not a separate project"),
+    ("aai-babel-verify", "babel", "babel is under aai/, not a root project"),
+    # Similar but different names
+    ("verify_aaa_licensed", "aaaa", "Different project name"),
+    ("verify_aaa_licensed", "aab", "Different project name"),
+    # Suffix pattern should be exact
+    ("docker-publish_bbsim", "bbsim-sadis-server", "bbsim-sadis-server is a different project"),
+    ("docker-publish_voltha-go", "voltha-go-controller", "Different project"),
+    # Random jobs should not match
+    ("random-unrelated-job", "aaa", "Unrelated job name"),
+    ("build-something-else", "bbsim", "Unrelated job name"),
+)
+NEGATIVE_TABLE = _case_table([(job, project, False) for job, project, _ in NEGATIVE_CASES])
+
+
+# Every hand-written row, negatives included, for implementation comparisons
+ALL_CASES = (
+    ONAP_CASES
+    + ONAP_MAPPING_CASES
+    + LFB_CASES
+    + tuple((job, project, False) for job, project, _ in NEGATIVE_CASES)
+)
+
+
 class TestNegativeCases:
     """
     Tests to ensure jobs don't incorrectly match wrong projects.
@@ -383,34 +561,35 @@ class TestNegativeCases:
     too permissive and creates false positive matches.
     """
 
-    @pytest.mark.parametrize(
-        "job_name,wrong_project,reason",
-        [
-            # Prefix should not match substring
-            ("sdc-tosca-verify", "tosca", "tosca is a component of sdc, not a separate project"),
-            ("aai-babel-verify", "babel", "babel is under aai/, not a root project"),
-            # Similar but different names
-            ("verify_aaa_licensed", "aaaa", "Different project name"),
-            ("verify_aaa_licensed", "aab", "Different project name"),
-            # Suffix pattern should be exact
-            (
-                "docker-publish_bbsim",
-                "bbsim-sadis-server",
-                "bbsim-sadis-server is a different project",
-            ),
-            ("docker-publish_voltha-go", "voltha-go-controller", "Different project"),
-            # Random jobs should not match
-            ("random-unrelated-job", "aaa", "Unrelated job name"),
-            ("build-something-else", "bbsim", "Unrelated job name"),
-        ],
+    # Lowercased and encoded once for the bytes scoring entry point
+    _CASES_B = tuple(
+        (
+            job.lower().encode(),
+            project.lower().encode(),
+            project.replace("/", "-").lower().encode(),
+            reason,
+        )
+        for job, project, reason in NEGATIVE_CASES
     )
-    def test_no_false_positives(self, jenkins_client, job_name, wrong_project, reason):
+
+    def test_negative_case_table(self, jenkins_client):
+        """Verify every negative case scores 0."""
+        scores = jenkins_client.score_job_matches_batch(
+            NEGATIVE_TABLE["job"], NEGATIVE_TABLE["project"], NEGATIVE_TABLE["pjn"]
+        )
+        _assert_case_table(scores, NEGATIVE_TABLE)
+
+    @CASE_SETTINGS
+    @given(case=st.sampled_from(_CASES_B))
+    def test_no_false_positives(self, jenkins_client, case):
         """Verify jobs don't match wrong projects."""
-        project_job_name = wrong_project.replace("/", "-")
-        score = jenkins_client._calculate_job_match_score(job_name, wrong_project, project_job_name)
+        job_name, wrong_project, project_job_name, reason = case
+        score = jenkins_client._calculate_job_match_score_bytes(
+            job_name, wrong_project, project_job_name
+        )
 
         assert score == 0, (
-            f"FALSE POSITIVE: '{job_name}' should NOT match '{wrong_project}' (reason: {reason})"
+            f"FALSE POSITIVE: {job_name!r} should NOT match {wrong_project!r} (reason: {reason})"
         )
 
     def test_partial_prefix_no_match(self, jenkins_client):
@@ -435,26 +614,25 @@ class TestNegativeCases:
 class TestNegativeProductionFixtures:
     """Test negative cases from production fixtures."""
 
-    def test_production_negative_cases(self, jenkins_client, production_fixtures):
+    def test_production_negative_cases(self, jenkins_client, production_tables):
         """Verify negative test cases from production fixtures."""
-        if "negative_test_cases" not in production_fixtures:
+        if "negative_test_cases" not in production_tables:
             pytest.skip("Negative test cases not available in fixtures")
 
-        negative_cases = production_fixtures["negative_test_cases"].get("cases", [])
+        table = production_tables["negative_test_cases"]
 
         failures = []
-        for case in negative_cases:
-            job_name = case["job"]
-            wrong_project = case["wrong_project"]
-            reason = case.get("reason", "No reason provided")
-
-            project_job_name = wrong_project.replace("/", "-")
+        for i in range(len(table["job"])):
+            job_name = str(table["job"][i])
+            wrong_project = str(table["project"][i])
             score = jenkins_client._calculate_job_match_score(
-                job_name, wrong_project, project_job_name
+                job_name, wrong_project, str(table["pjn"][i])
             )
 
             if score > 0:
-                failures.append(f"{job_name} incorrectly matched {wrong_project}: {reason}")
+                failures.append(
+                    f"{job_name} incorrectly matched {wrong_project}: {table['reason'][i]}"
+                )
 
         assert len(failures) == 0, "FALSE POSITIVES detected:\n" + "\n".join(failures)
 
@@ -541,6 +719,30 @@ class TestEdgeCases:
         )
         assert isinstance(score, int)
 
+    @pytest.mark.parametrize(
+        "job_name,project_name,project_job_name,expected",
+        _params(
+            "fold",
+            [
+                ("SDC", "sdc", "sdc", 1050),
+                ("aai-Babel", "aai/babel", "AAI-babel", 1100),
+                ("项目-ÄBC", "项目/äbc", "项目-äbc", 1100),
+                ("Straße", "strasse", "strasse", 0),
+            ],
+        ),
+    )
+    def test_exact_match_case_folding(
+        self, jenkins_client, job_name, project_name, project_job_name, expected
+    ):
+        """Exact matches ignore case for both ASCII and non-ASCII names."""
+        score = jenkins_client._calculate_job_match_score(job_name, project_name, project_job_name)
+        assert score == expected
+
+    def test_exact_match_same_object(self, jenkins_client):
+        """Passing the same string as job and project job name is an exact match."""
+        name = "aai-babel"
+        assert jenkins_client._calculate_job_match_score(name, "aai/babel", name) == 1100
+
     def test_numeric_project_names(self, jenkins_client):
         """Numeric project names should work."""
         score = jenkins_client._calculate_job_match_score("5g-core-verify", "5g/core", "5g-core")
@@ -548,6 +750,412 @@ class TestEdgeCases:
         assert score > 0
 
 
+# =============================================================================
+# Test: Match Index
+# =============================================================================
+
+
+class TestMatchIndex:
+    """Tests that the prebuilt match index scores exactly like direct matching."""
+
+    @pytest.mark.parametrize(
+        "job_name,project_name",
+        _params(
+            "index",
+            [
+                ("sdc", "sdc"),
+                ("SDC-verify-java", "sdc"),
+                ("bbsim_scale_test", "bbsim"),
+                ("docker-publish_bbsim", "bbsim"),
+                ("verify_aaa_licensed", "aaa"),
+                ("verify_aaa", "aaa"),
+                ("verify_aaaa_licensed", "aaa"),
+                ("patchset-voltha-go-test", "voltha-go"),
+                ("aai-babel-verify", "babel"),
+                ("sdc-tosca-verify", "tosca"),
+                ("aai-babel-maven-verify", "aai/babel"),
+                ("test-项目-verify", "test/项目"),
+            ],
+        ),
+    )
+    def test_indexed_score_matches_direct_score(self, make_client, job_name, project_name):
+        """Indexed and unindexed clients must return identical scores."""
+        project_job_name = project_name.replace("/", "-")
+        indexed = make_client()
+        direct = make_client()
+        indexed._build_match_index([project_name, "aai", "voltha", "bbsim-sadis-server"])
+        assert indexed._calculate_job_match_score(
+            job_name, project_name, project_job_name
+        ) == direct._calculate_job_match_score(job_name, project_name, project_job_name)
+
+    def test_walk_resolves_all_indexed_projects(self, jenkins_client, make_client):
+        """A single lookup reports every indexed project occurring in the job name."""
+        hits = jenkins_client._match_index_lookup("aai-babel-verify")
+        assert hits == {"aai-babel": 500, "babel": 0}
+
+        # Use a separate client so the shared session index is left untouched
+        client = make_client()
+        client._build_match_index(["aai", "aai/babel", "babel", "tosca"])
+        hits = client._match_index_lookup("aai-babel-verify")
+        assert hits == {"aai": 500, "aai-babel": 500, "babel": 0}
+
+    def test_absent_project_skips_remaining_patterns(self, make_client):
+        """An indexed project absent from the job name scores 0 from the index alone."""
+        client = make_client()
+        client._build_match_index(["voltha", "tosca"])
+        assert client._lookup_match_index("patchset-voltha-test", "tosca") == (
+            jenkins_client_module._NO_OCCURRENCE
+        )
+        assert client._lookup_match_index("patchset-voltha-test", "voltha") == 0
+        assert client._calculate_job_match_score("patchset-voltha-test", "tosca", "tosca") == 0
+        assert client._calculate_job_match_score("patchset-voltha-test", "voltha", "voltha") == 430
+
+    @pytest.mark.skipif(
+        not jenkins_client_module.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed"
+    )
+    def test_automaton_matches_trie_walk(self, make_client, monkeypatch):
+        """The Aho-Corasick matcher reports the same hits as the trie walk."""
+        jobs = [job for job, _, _ in ALL_CASES] + [job for job, _ in BATCH_CASES]
+        jobs += ["verify_aai", "verify_aai_babel", "x_aai-babel", "aai_babel", "aai"]
+        lookup = JenkinsAPIClient._compile_match_automaton(INDEXED_PROJECTS)
+
+        monkeypatch.setattr(jenkins_client_module, "AHOCORASICK_AVAILABLE", False)
+        client = make_client()
+        client._build_match_index(INDEXED_PROJECTS)
+        for job in jobs:
+            assert lookup(job.lower()) == client._walk_match_index(job.lower()), job
+
+    def test_scores_are_memoized_until_projects_change(self, make_client):
+        """Repeated scoring hits the LRU cache; a new project set clears it."""
+        client = make_client()
+        client._build_match_index(["sdc"])
+        for _ in range(3):
+            assert client._calculate_job_match_score("sdc-verify", "sdc", "sdc") == 550
+        info = client._score_cache.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+        client._build_match_index(["sdc"])
+        assert client._score_cache.cache_info().currsize == 1
+
+        client._build_match_index(["sdc", "aai/babel"])
+        assert client._score_cache.cache_info().currsize == 0
+
+    def test_score_cache_does_not_keep_client_alive(self, mock_stats):
+        """The per-client score cache holds no reference cycle back to the client."""
+        client = _offline_client(mock_stats)
+        client._calculate_job_match_score("sdc-verify", "sdc", "sdc")
+        client.close()
+        ref = weakref.ref(client)
+        del client
+        assert ref() is None
+
+    def test_scorer_patchable_on_class(self, jenkins_client):
+        """The scorer is a class attribute, so class-level patches reach instances."""
+        with patch.object(JenkinsAPIClient, "_calculate_job_match_score", return_value=7):
+            assert jenkins_client._calculate_job_match_score("sdc-verify", "sdc", "sdc") == 7
+
+    def test_cached_scorer_resolves_method_per_call(self, make_client):
+        """Patching the uncached scorer on the class reaches existing instances."""
+        client = make_client()
+        with patch.object(JenkinsAPIClient, "_score_job_match", return_value=7) as scorer:
+            assert client._calculate_job_match_score("sdc-verify", "sdc", "sdc") == 7
+        scorer.assert_called_once_with("sdc-verify", "sdc", "sdc")
+
+    def test_tail_table_reports_every_suffix(self):
+        """Suffix lookups probe one tail per distinct project name length."""
+        tail_lengths, tails = jenkins_client_module._compile_tail_table(
+            ["go", "voltha-go", "bbsim"]
+        )
+        assert tail_lengths == (3, 6, 10)
+
+        matches = jenkins_client_module._iter_tail_matches
+        assert list(matches("docker-publish_voltha-go", tail_lengths, tails)) == ["voltha-go"]
+        assert list(matches("x_voltha_go", tail_lengths, tails)) == ["go"]
+        assert list(matches("_go", tail_lengths, tails)) == ["go"]
+        assert list(matches("go", tail_lengths, tails)) == []
+
+    def test_rebuild_with_same_projects_keeps_matcher(self, make_client):
+        """Rebuilding with an unchanged project set reuses the compiled matcher."""
+        client = make_client()
+        client._build_match_index(["sdc", "aai/babel"])
+        lookup = client._match_index_lookup
+        client._build_match_index(["aai-babel", "SDC"])
+        assert client._match_index_lookup is lookup
+
+        client._build_match_index(["sdc"])
+        assert client._match_index_lookup is not lookup
+
+    def test_jobs_cache_rebuild_clears_memoized_walks(self, jenkins_client):
+        """Refreshing the jobs cache drops walks memoized for the old job set."""
+        jenkins_client._lookup_match_index("sdc-verify", "sdc")
+        assert "sdc-verify" in jenkins_client._match_index_hits
+
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {"jobs": [{"name": "sdc-verify"}]}
+        with patch.object(jenkins_client.client, "get", return_value=mock_response):
+            jenkins_client.get_all_jobs()
+
+        assert jenkins_client._match_index_hits == {}
+
+    def test_reset_cache(self, jenkins_client):
+        """reset_cache drops cached jobs and memoized walks but keeps the index."""
+        jenkins_client._jobs_cache = {"jobs": [{"name": "sdc-verify"}]}
+        jenkins_client._cache_populated = True
+        jenkins_client._lookup_match_index("sdc-verify", "sdc")
+
+        jenkins_client.reset_cache()
+
+        assert jenkins_client._jobs_cache == {}
+        assert jenkins_client._cache_populated is False
+        assert jenkins_client._match_index_hits == {}
+        assert "sdc" in jenkins_client._match_index_projects
+
+
+# =============================================================================
+# Test: Orphaned Job Allocation
+# =============================================================================
+
+
+class TestOrphanedJobAllocation:
+    """Test matching unallocated jobs to archived Gerrit projects."""
+
+    JOBS = {"aai-babel-maven-verify", "verify_tosca", "sdc-verify", "unrelated-job"}
+    EXPECTED = {
+        "aai-babel-maven-verify": {"project_name": "aai/babel", "state": "READ_ONLY", "score": 600},
+        "verify_tosca": {"project_name": "tosca", "state": "HIDDEN", "score": 500},
+    }
+
+    @pytest.fixture
+    def collector(self, monkeypatch):
+        """Create a GitDataCollector with Gerrit and Jenkins discovery disabled."""
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        collector = GitDataCollector(
+            {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}, {}, Mock()
+        )
+        collector.gerrit_projects_cache = {
+            "aai/babel": {"state": "READ_ONLY"},
+            "babel": {"state": "READ_ONLY"},
+            "tosca": {"state": "HIDDEN"},
+            "sdc": {"state": "ACTIVE"},
+        }
+        return collector
+
+    def test_indexed_client(self, collector, make_client):
+        """A real client indexes the archived projects and scores through the index."""
+        client = make_client()
+        collector.jenkins_client = client
+
+        collector._allocate_orphaned_jobs_to_archived_projects(set(self.JOBS))
+
+        assert collector.jenkins_allocation_context.get_orphaned_jobs() == self.EXPECTED
+        assert client._match_index_projects == {"aai-babel", "babel", "tosca"}
+        assert "unrelated-job" in client._match_index_hits
+
+    def test_mock_client(self, collector):
+        """A mocked client receives the archived projects and supplies the scores."""
+        client = Mock(spec=JenkinsAPIClient)
+        client._calculate_job_match_score.side_effect = lambda job, project, pjn: {
+            ("aai-babel-maven-verify", "aai/babel"): 600,
+            ("verify_tosca", "tosca"): 500,
+        }.get((job, project), 0)
+        collector.jenkins_client = client
+
+        collector._allocate_orphaned_jobs_to_archived_projects(set(self.JOBS))
+
+        assert collector.jenkins_allocation_context.get_orphaned_jobs() == self.EXPECTED
+        client._build_match_index.assert_called_once()
+        assert set(client._build_match_index.call_args.args[0]) == {"aai/babel", "babel", "tosca"}
+        assert client._calculate_job_match_score.call_count == len(self.JOBS) * 3
+
+
+# =============================================================================
+# Test: Compiled Match Kernel
+# =============================================================================
+
+
+class TestMatchKernel:
+    """Tests that the compiled leading pattern kernel agrees with pure Python."""
+
+    CASES = (
+        ("sdc", "sdc"),
+        ("sdc-verify-java", "sdc"),
+        ("sdcabc-verify", "sdc"),
+        ("bbsim_scale_test", "bbsim"),
+        ("docker-publish_bbsim", "bbsim"),
+        ("docker-publish-bbsim", "bbsim"),
+        ("verify_aaa_licensed", "aaa"),
+        ("verify_aaa", "aaa"),
+        ("verify_aaaa_licensed", "aaa"),
+        ("verify_", "aaa"),
+        ("aaa", "verify_aaa"),
+        ("_aaa", "aaa"),
+        ("aa", "aaa"),
+        ("test-项目-verify", "test-项目"),
+    )
+    PARAMS = _params("kernel", CASES)
+
+    @pytest.mark.parametrize("job_name,project_job_name", PARAMS)
+    def test_kernel_matches_pure_python(self, jenkins_client, job_name, project_job_name):
+        """Compiled kernel must return the same base score as the Python path."""
+        if jenkins_client._match_kernel is None:
+            pytest.skip("Compiled match kernel not available (Numba not installed)")
+
+        expected = JenkinsAPIClient._match_leading_patterns(job_name, project_job_name)
+        actual = jenkins_client._match_kernel(
+            job_name.encode("utf-8"), project_job_name.encode("utf-8")
+        )
+        assert actual == expected
+
+    @pytest.mark.parametrize("job_name,project_job_name", PARAMS)
+    def test_cython_kernel_matches_pure_python(self, job_name, project_job_name):
+        """Cython kernel, when built, must agree with the Python path."""
+        cython_match = pytest.importorskip("api._match", reason="Cython kernel not built")
+
+        expected = JenkinsAPIClient._match_leading_patterns(job_name, project_job_name)
+        actual = cython_match.score(job_name.encode("utf-8"), project_job_name.encode("utf-8"))
+        assert actual == expected
+
+    @pytest.mark.parametrize("job_name,project_job_name", PARAMS)
+    def test_bytes_fallback_matches_str(self, job_name, project_job_name):
+        """The pure-Python bytes fallback must agree with the str implementation."""
+        expected = JenkinsAPIClient._match_leading_patterns(job_name, project_job_name)
+        actual = JenkinsAPIClient._match_leading_patterns_bytes(
+            job_name.encode("utf-8"), project_job_name.encode("utf-8")
+        )
+        assert actual == expected
+
+    def test_bytes_entry_point_matches_str(self, jenkins_client):
+        """Scoring pre-lowercased bytes must match scoring the original strings."""
+        cases = [(job, project) for job, project, _ in ALL_CASES] + BATCH_CASES
+        for job, project in cases:
+            pjn = project.replace("/", "-")
+            expected = jenkins_client._calculate_job_match_score(job, project, pjn)
+            actual = jenkins_client._calculate_job_match_score_bytes(
+                job.lower().encode(), project.lower().encode(), pjn.lower().encode()
+            )
+            assert actual == expected, f"{job} -> {project}"
+
+    def test_bytes_entry_point_scores_misses_once(self, jenkins_client):
+        """A leading-pattern miss on bytes goes straight to patterns 5-8."""
+        score_bytes = jenkins_client._calculate_job_match_score_bytes
+        with patch.object(JenkinsAPIClient, "_calculate_job_match_score") as scorer:
+            assert score_bytes(b"patchset-voltha-test", b"voltha", b"voltha") == 430
+            assert score_bytes(b"sdc-tosca-verify", b"tosca", b"tosca") == 0
+        scorer.assert_not_called()
+
+
+# =============================================================================
+# Test: Batch Scoring
+# =============================================================================
+
+
+BATCH_CASES = [
+    ("sdc", "sdc"),
+    ("SDC-verify-java", "sdc"),
+    ("aai-babel-maven-verify-master", "aai/babel"),
+    ("aai-babel-maven-verify-master", "aai"),
+    ("bbsim_scale_test", "bbsim"),
+    ("docker-publish_bbsim", "bbsim"),
+    ("docker-publish_bbsim", "bbsim-sadis-server"),
+    ("verify_aaa_licensed", "aaa"),
+    ("verify_aaa", "aaa"),
+    ("verify_aaa_licensed", "aab"),
+    ("patchset-voltha-2.14-multiple-olts", "voltha"),
+    ("build_berlin-pod-1_DT_voltha_master", "voltha"),
+    ("sdc-tosca-verify", "tosca"),
+    ("docker-build-voltha", "voltha"),
+    ("random-unrelated-job", "aaa"),
+    ("", "aaa"),
+    ("test-job", ""),
+]
+
+
+class TestBatchScoring:
+    """Tests that the vectorized batch scorer agrees with the scalar scorer."""
+
+    def test_batch_matches_scalar(self, jenkins_client):
+        """Batch scores must equal per-pair scalar scores."""
+        jobs = [job for job, _ in BATCH_CASES]
+        projects = [project for _, project in BATCH_CASES]
+        pjns = [project.replace("/", "-") for project in projects]
+
+        scores = jenkins_client.score_job_matches_batch(
+            np.array(jobs), np.array(projects), np.array(pjns)
+        )
+
+        expected = [
+            jenkins_client._calculate_job_match_score(job, project, pjn)
+            for job, project, pjn in zip(jobs, projects, pjns)
+        ]
+        assert scores.dtype == np.int32
+        assert scores.tolist() == expected
+
+    def test_case_tables_batch_matches_scalar(self, jenkins_client):
+        """Batch scores for every case table row must equal the scalar scores."""
+        cases = _case_table(ALL_CASES)
+        scores = jenkins_client.score_job_matches_batch(
+            cases["job"], cases["project"], cases["pjn"]
+        )
+
+        expected = [
+            jenkins_client._calculate_job_match_score(str(job), str(project), str(pjn))
+            for job, project, pjn in zip(cases["job"], cases["project"], cases["pjn"])
+        ]
+        assert scores.tolist() == expected
+
+    @CASE_SETTINGS
+    @given(cases=st.lists(st.sampled_from(ALL_CASES), min_size=1, max_size=256))
+    def test_scalar_matches_batch_on_random_subsets(self, jenkins_client, cases):
+        """Scalar and batch scoring agree on any subset of the case rows."""
+        table = _case_table(cases)
+        scores = jenkins_client.score_job_matches_batch(
+            table["job"], table["project"], table["pjn"]
+        )
+
+        expected = [
+            jenkins_client._calculate_job_match_score(job, project, project.replace("/", "-"))
+            for job, project, _ in cases
+        ]
+        assert scores.tolist() == expected
+
+    def test_batch_broadcasts_to_grid(self, jenkins_client):
+        """Broadcasting jobs against projects scores the full grid."""
+        jobs = np.array(["aai-babel-verify", "verify_aaa_licensed", "unrelated"])
+        projects = np.array(["aai", "aai/babel", "aaa"])
+        pjns = np.char.replace(projects, "/", "-")
+
+        grid = jenkins_client.score_job_matches_batch(
+            jobs[:, None], projects[None, :], pjns[None, :]
+        )
+
+        assert grid.shape == (3, 3)
+        for i, job in enumerate(jobs):
+            for j, project in enumerate(projects):
+                assert grid[i, j] == jenkins_client._calculate_job_match_score(
+                    str(job), str(project), str(pjns[j])
+                )
+
+    def test_batch_skips_scalar_for_absent_projects(self, jenkins_client):
+        """Pairs whose project job name is absent from the job skip the scalar scorer."""
+        jobs = np.array(["ci-management-jjb-verify", "docker-publish_bbsim", "sdc-tosca-verify"])
+        projects = np.array(["aai/babel", "voltha-go", "cps", "integration"])
+        pjns = np.char.replace(projects, "/", "-")
+
+        with patch.object(JenkinsAPIClient, "_calculate_job_match_score") as scalar:
+            grid = jenkins_client.score_job_matches_batch(
+                jobs[:, None], projects[None, :], pjns[None, :]
+            )
+
+        scalar.assert_not_called()
+        assert grid.shape == (3, 4)
+        assert not grid.any()
+
+    def test_batch_empty_input(self, jenkins_client):
+        """Empty input returns an empty score array."""
+        scores = jenkins_client.score_job_matches_batch(np.array([]), np.array([]), np.array([]))
+        assert scores.shape == (0,)
+
+
 # =============================================================================
 # Test: Pattern Documentation
 # =============================================================================